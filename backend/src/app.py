@@ -19,6 +19,7 @@ from .api.routes import call as call_routes
 from .api import webhooks
 from .utils.config import get_settings
 from .utils.logger import setup_logging, get_logger
+from .utils.openai_client import close_openai_client
 from .utils.exceptions import AICallingAgentException
 
 # Initialize settings and logging
@@ -44,17 +45,32 @@ async def lifespan(app: FastAPI):
     # Health checks
     await perform_startup_health_checks()
 
+    # Pre-synthesize common phrases in the background; a slow TTS API must not
+    # hold up startup
+    warmup_task = None
+    if settings.tts.warmup_phrases:
+        from .tts.openai_tts import openai_tts
+        warmup_task = asyncio.create_task(openai_tts.warm_cache(settings.tts.warmup_phrases))
+
     yield
 
     # Shutdown
     logger.info("Shutting down AI Calling Agent backend")
 
+    # Stop a warm-up that is still running
+    if warmup_task is not None:
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+
     # Stop session cleanup task
     await session_manager.stop_session_cleanup_task()
 
     # Close database connections
     await db_manager.close()
 
+    # Close the shared OpenAI connection pool
+    await close_openai_client()
+
     logger.info("Shutdown complete")
 
 
@@ -63,7 +63,7 @@ def create_access_token(
         algorithm=settings.jwt.algorithm
     )
 
-    logger.debug(f"Access token created for user {email}")
+    logger.debug("Access token created", email=email)
 
     return encoded_jwt
 
@@ -93,5 +93,5 @@ def verify_token(token: str) -> Optional[TokenData]:
         )
 
     except JWTError as e:
-        logger.warning(f"Invalid token: {str(e)}")
+        logger.warning("Invalid token", error=str(e))
         return None
\ No newline at end of file
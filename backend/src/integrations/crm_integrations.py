@@ -418,7 +418,7 @@ class CRMManager(LoggerMixin):
     def register_integration(self, name: str, integration: BaseCRMIntegration):
         """Register a CRM integration."""
         self.integrations[name] = integration
-        self.logger.info(f"CRM integration registered: {name}")
+        self.logger.info("CRM integration registered", crm=name)
 
     async def get_contact_from_all_crms(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """Try to find contact in all registered CRMs."""
@@ -426,10 +426,10 @@ class CRMManager(LoggerMixin):
             try:
                 contact = await crm.get_contact(phone_number)
                 if contact:
-                    self.logger.info(f"Contact found in {name}", phone_number=phone_number)
+                    self.logger.info("Contact found in CRM", crm=name, phone_number=phone_number)
                     return contact
             except Exception as e:
-                self.logger.error(f"Error searching {name} for contact", error=str(e))
+                self.logger.error("Error searching CRM for contact", crm=name, error=str(e))
 
         return None
 
@@ -442,9 +442,9 @@ class CRMManager(LoggerMixin):
                 result = await crm.create_call_log(call_data)
                 result["crm"] = name
                 results.append(result)
-                self.logger.info(f"Call synced to {name}", call_id=call_data.get("id"))
+                self.logger.info("Call synced to CRM", crm=name, call_id=call_data.get("id"))
             except Exception as e:
-                self.logger.error(f"Failed to sync call to {name}", error=str(e))
+                self.logger.error("Failed to sync call to CRM", crm=name, error=str(e))
                 results.append({"crm": name, "error": str(e)})
 
         return results
@@ -457,7 +457,7 @@ class CRMManager(LoggerMixin):
             try:
                 results[name] = await crm.health_check()
             except Exception as e:
-                self.logger.error(f"Health check failed for {name}", error=str(e))
+                self.logger.error("CRM health check failed", crm=name, error=str(e))
                 results[name] = False
 
         return results
@@ -6,15 +6,13 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
-from openai import AsyncOpenAI
 import tiktoken
+from openai import AsyncOpenAI
 
-from ..utils.config import get_settings
 from ..utils.logger import LoggerMixin
+from ..utils.openai_client import get_openai_client
 from ..utils.exceptions import NLPError, LLMError
 
-settings = get_settings()
-
 
 class ConversationState(str, Enum):
     """Conversation state machine."""
@@ -46,7 +44,6 @@ class OpenAINLP(LoggerMixin):
     """OpenAI-powered NLP agent for human-like conversations."""
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.external_apis.openai_api_key)
         self.model = "gpt-4"  # Use GPT-4 for better conversation quality
         self.encoding = tiktoken.encoding_for_model(self.model)
         self.max_tokens = 8192
@@ -77,6 +74,11 @@ Your goal is to have natural, helpful conversations while being respectful of pe
 - Thank people for their time"""
         }
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Shared OpenAI client, looked up per call so a closed one is never reused."""
+        return get_openai_client()
+
     async def process_conversation_turn(
             self,
             call_id: str,
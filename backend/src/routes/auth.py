@@ -50,7 +50,7 @@ async def register(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Registration error: {str(e)}")
+        logger.error("Registration error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Registration failed"
@@ -93,7 +93,7 @@ async def login(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
@@ -129,7 +129,7 @@ async def change_password(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Change password error: {str(e)}")
+        logger.error("Change password error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to change password"
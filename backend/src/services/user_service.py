@@ -48,7 +48,7 @@ class UserService:
         await session.commit()
         await session.refresh(user)
 
-        logger.info(f"User created: {user.email}")
+        logger.info("User created", email=user.email)
         return user
 
     async def get_user_by_email(
@@ -89,7 +89,7 @@ class UserService:
         if not user.is_active:
             raise InvalidCredentialsError("User account is inactive")
 
-        logger.info(f"User authenticated: {email}")
+        logger.info("User authenticated", email=email)
         return user
 
     async def update_last_login(
@@ -124,7 +124,7 @@ class UserService:
         user.password_hash = hash_password(new_password)
         await session.commit()
 
-        logger.info(f"Password changed for user: {user.email}")
+        logger.info("Password changed", email=user.email)
 
 
 # Global service instance
@@ -7,22 +7,23 @@ from pathlib import Path
 
 import httpx
 import openai
-from openai import AsyncOpenAI
 
-from ..utils.config import get_settings
 from ..utils.logger import LoggerMixin
+from ..utils.openai_client import get_openai_client
 from ..utils.exceptions import STTError
 
-settings = get_settings()
-
 
 class OpenAISTT(LoggerMixin):
     """OpenAI Whisper Speech-to-Text service."""
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.external_apis.openai_api_key)
         self.model = "whisper-1"
 
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """Shared OpenAI client, looked up per call so a closed one is never reused."""
+        return get_openai_client()
+
     async def transcribe_audio(
             self,
             audio_data: bytes,
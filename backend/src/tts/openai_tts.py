@@ -1,37 +1,102 @@
 """OpenAI Text-to-Speech implementation."""
 
 import asyncio
+import hashlib
+import os
+import re
 import tempfile
-from typing import Optional, Dict, Any, AsyncGenerator, Literal
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Optional, Dict, Any, AsyncGenerator, AsyncIterator, ClassVar, List, Literal, Mapping, Tuple
+)
 from pathlib import Path
 import io
 
-from openai import AsyncOpenAI
+import aiofiles
 import httpx
+from openai import AsyncOpenAI
 
 from ..utils.config import get_settings
 from ..utils.logger import LoggerMixin
-from ..utils.exceptions import TTSError
+from ..utils.openai_client import get_openai_client
+from ..utils.exceptions import BulkOperationError, TTSError
+
+# Content-addressed cache of phone-ready clips served to Twilio
+_TWILIO_AUDIO_DIR = Path(tempfile.gettempdir()) / "twilio_tts"
+_TWILIO_CACHE_MAX_BYTES = get_settings().tts.twilio_cache_max_mb * 1024 * 1024
+
+# Matches a single word for duration estimates without building a list of tokens
+_WORD_RE = re.compile(r"\S+")
+
+
+@lru_cache(maxsize=2048)
+def _estimate_duration(word_count: int, speed: float) -> float:
+    """Estimate speech duration in seconds from word count and speed."""
+    # Rough estimation: average speaking rate is ~150 words per minute
+    base_duration = (word_count / 150) * 60  # Convert to seconds
+
+    # Adjust for speed
+    estimated_duration = base_duration / speed
+
+    # Add buffer for natural pauses and pronunciation
+    estimated_duration *= 1.2
+
+    return max(1.0, estimated_duration)  # Minimum 1 second
 
-settings = get_settings()
+
+async def _drain_bytes(chunks: AsyncIterator[bytes]) -> bytes:
+    """Collect an async byte stream, growing a bytearray instead of re-copying bytes."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer.extend(chunk)
+    return bytes(buffer)
 
 
 class OpenAITTS(LoggerMixin):
     """OpenAI Text-to-Speech service for human-like voice generation."""
 
+    __slots__ = ("_audio_cache", "_audio_cache_bytes")
+
+    MODEL: ClassVar[str] = "tts-1-hd"  # High-definition model for better quality
+
+    # Available voices - these sound very human-like
+    VOICES: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'alloy': 'Neutral, balanced voice',
+        'echo': 'Male, clear and professional',
+        'fable': 'British accent, storytelling',
+        'onyx': 'Deep male voice, authoritative',
+        'nova': 'Young female, energetic',
+        'shimmer': 'Soft female, gentle and warm'
+    })
+
+    # Emotional context prepended to the text; unknown emotions (incl. "neutral") get none
+    _EMOTIONAL_PROMPTS: ClassVar[Dict[str, str]] = {
+        "happy": "Say this with joy and enthusiasm: ",
+        "sad": "Say this with a gentle, sorrowful tone: ",
+        "excited": "Say this with high energy and excitement: ",
+        "calm": "Say this in a peaceful, relaxed manner: ",
+        "professional": "Say this in a clear, professional tone: ",
+        "friendly": "Say this in a warm, friendly way: ",
+        "urgent": "Say this with urgency and importance: ",
+        "empathetic": "Say this with compassion and understanding: "
+    }
+
+    # Limits of the in-memory LRU cache: clip count, total bytes, and the largest
+    # single clip worth keeping (long wav/flac/pcm clips run to megabytes)
+    _CACHE_MAX_ENTRIES: ClassVar[int] = 256
+    _CACHE_MAX_BYTES: ClassVar[int] = get_settings().tts.memory_cache_max_mb * 1024 * 1024
+    _CACHE_MAX_CLIP_BYTES: ClassVar[int] = 1024 * 1024
+
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.external_apis.openai_api_key)
-        self.model = "tts-1-hd"  # High-definition model for better quality
-
-        # Available voices - these sound very human-like
-        self.voices = {
-            'alloy': 'Neutral, balanced voice',
-            'echo': 'Male, clear and professional',
-            'fable': 'British accent, storytelling',
-            'onyx': 'Deep male voice, authoritative',
-            'nova': 'Young female, energetic',
-            'shimmer': 'Soft female, gentle and warm'
-        }
+        self._audio_cache: "OrderedDict[Tuple[str, str, str, float], bytes]" = OrderedDict()
+        self._audio_cache_bytes = 0
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Shared OpenAI client, looked up per call so a closed one is never reused."""
+        return get_openai_client()
 
     async def synthesize_speech(
             self,
@@ -54,7 +119,7 @@ class OpenAITTS(LoggerMixin):
         """
         try:
             # Validate inputs
-            if not text.strip():
+            if not text or text.isspace():
                 raise TTSError("Text cannot be empty")
 
             if len(text) > 4096:
@@ -64,9 +129,16 @@ class OpenAITTS(LoggerMixin):
             if not 0.25 <= speed <= 4.0:
                 speed = max(0.25, min(4.0, speed))
 
+            # Serve repeated phrases from the cache
+            cache_key = self._cache_key(text, voice, response_format, speed)
+            cached_audio = self._audio_cache.get(cache_key)
+            if cached_audio is not None:
+                self._audio_cache.move_to_end(cache_key)
+                return cached_audio
+
             # Generate speech
             response = await self.client.audio.speech.create(
-                model=self.model,
+                model=self.MODEL,
                 voice=voice,
                 input=text,
                 response_format=response_format,
@@ -74,9 +146,7 @@ class OpenAITTS(LoggerMixin):
             )
 
             # Get audio data
-            audio_data = b""
-            async for chunk in response.iter_bytes():
-                audio_data += chunk
+            audio_data = await _drain_bytes(response.iter_bytes())
 
             self.logger.info(
                 "Speech synthesized successfully",
@@ -86,6 +156,8 @@ class OpenAITTS(LoggerMixin):
                 audio_size=len(audio_data)
             )
 
+            self._cache_audio(cache_key, audio_data)
+
             return audio_data
 
         except Exception as e:
@@ -111,7 +183,7 @@ class OpenAITTS(LoggerMixin):
         """
         try:
             response = await self.client.audio.speech.create(
-                model=self.model,
+                model=self.MODEL,
                 voice=voice,
                 input=text,
                 response_format="mp3",  # Good for streaming
@@ -146,23 +218,12 @@ class OpenAITTS(LoggerMixin):
         Returns:
             Audio data with emotional inflection
         """
-        # Add emotional context to the text
-        emotional_prompts = {
-            "happy": "Say this with joy and enthusiasm: ",
-            "sad": "Say this with a gentle, sorrowful tone: ",
-            "excited": "Say this with high energy and excitement: ",
-            "calm": "Say this in a peaceful, relaxed manner: ",
-            "professional": "Say this in a clear, professional tone: ",
-            "friendly": "Say this in a warm, friendly way: ",
-            "urgent": "Say this with urgency and importance: ",
-            "empathetic": "Say this with compassion and understanding: "
-        }
-
-        prompt = emotional_prompts.get(emotion.lower(), "")
-        enhanced_text = f"{prompt}{text}" if prompt else text
+        prompt = self._EMOTIONAL_PROMPTS.get(emotion.lower())
+        if not prompt:
+            return await self.synthesize_speech(text=text, voice=voice, speed=speed)
 
         return await self.synthesize_speech(
-            text=enhanced_text,
+            text=f"{prompt}{text}",
             voice=voice,
             speed=speed
         )
@@ -170,7 +231,8 @@ class OpenAITTS(LoggerMixin):
     async def synthesize_conversation_chunks(
             self,
             conversation_parts: list[Dict[str, Any]],
-            voice: str = "nova"
+            voice: str = "nova",
+            max_concurrency: int = 4
     ) -> Dict[str, bytes]:
         """
         Synthesize multiple parts of a conversation with appropriate pacing.
@@ -178,39 +240,107 @@ class OpenAITTS(LoggerMixin):
         Args:
             conversation_parts: List of conversation segments with metadata
             voice: Voice to use
+            max_concurrency: Maximum parallel synthesis requests
 
         Returns:
             Dictionary mapping part IDs to audio data
+
+        Raises:
+            TTSError: If every part failed
+            BulkOperationError: If only some parts failed; the synthesized audio
+                is attached as ``results`` and ``(index, error)`` pairs for
+                failed parts as ``failed_items``
         """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def synthesize(text: str, emotion: str, speed: float) -> bytes:
+            async with semaphore:
+                return await self.synthesize_with_emotions(
+                    text=text,
+                    emotion=emotion,
+                    voice=voice,
+                    speed=speed
+                )
+
+        synthesis_tasks = []
+
+        for part in conversation_parts:
+            text = part.get('text', '')
+            emotion = part.get('emotion', 'neutral')
+            speed = part.get('speed', 1.0)
+            pause_before = part.get('pause_before', 0)
+
+            # Add natural pauses for conversation flow
+            if pause_before > 0:
+                silence_text = "..." * max(1, pause_before // 500)  # Rough pause
+                text = f"{silence_text} {text}"
+
+            synthesis_tasks.append(synthesize(text, emotion, speed))
+
+        outcomes = await asyncio.gather(*synthesis_tasks, return_exceptions=True)
+
         results = {}
+        failed = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                failed.append((i, str(outcome)))
+            else:
+                results[f"part_{i}"] = outcome
+
+        if failed:
+            self.logger.error(
+                "Conversation synthesis failed",
+                failed_count=len(failed),
+                succeeded_count=len(results)
+            )
+            if not results:
+                raise TTSError(f"Conversation synthesis failed: {failed[0][1]}")
+            raise BulkOperationError(
+                "Conversation synthesis partially failed",
+                failed_items=failed,
+                successful_items=list(results.keys()),
+                results=results
+            )
 
-        try:
-            for i, part in enumerate(conversation_parts):
-                text = part.get('text', '')
-                emotion = part.get('emotion', 'neutral')
-                speed = part.get('speed', 1.0)
-                pause_before = part.get('pause_before', 0)
+        self.logger.info("Conversation chunks synthesized", parts_count=len(results))
+        return results
 
-                # Add natural pauses for conversation flow
-                if pause_before > 0:
-                    silence_text = "..." * max(1, pause_before // 500)  # Rough pause
-                    text = f"{silence_text} {text}"
+    async def warm_cache(
+            self,
+            phrases: List[Tuple[str, str, str]],
+            speed: float = 0.9,
+            max_concurrency: int = 4
+    ) -> None:
+        """
+        Pre-synthesize common phrases so the first calls skip TTS latency.
 
-                audio_data = await self.synthesize_with_emotions(
+        Args:
+            phrases: (text, voice, emotion) items to synthesize
+            speed: Speech speed; matches the speed used for live calls
+            max_concurrency: Maximum parallel synthesis requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def warm(text: str, voice: str, emotion: str) -> bytes:
+            async with semaphore:
+                return await self.synthesize_with_emotions(
                     text=text,
                     emotion=emotion,
                     voice=voice,
                     speed=speed
                 )
 
-                results[f"part_{i}"] = audio_data
-
-            self.logger.info("Conversation chunks synthesized", parts_count=len(results))
-            return results
+        outcomes = await asyncio.gather(
+            *(warm(text, voice, emotion) for text, voice, emotion in phrases),
+            return_exceptions=True
+        )
 
-        except Exception as e:
-            self.logger.error("Conversation synthesis failed", error=str(e))
-            raise TTSError(f"Conversation synthesis failed: {str(e)}")
+        failed_count = sum(1 for outcome in outcomes if isinstance(outcome, BaseException))
+        self.logger.info(
+            "TTS cache warmed",
+            phrases_count=len(outcomes),
+            failed_count=failed_count
+        )
 
     async def get_speech_duration(self, text: str, voice: str = "nova", speed: float = 1.0) -> float:
         """
@@ -225,17 +355,8 @@ class OpenAITTS(LoggerMixin):
             Estimated duration in seconds
         """
         try:
-            # Rough estimation: average speaking rate is ~150 words per minute
-            word_count = len(text.split())
-            base_duration = (word_count / 150) * 60  # Convert to seconds
-
-            # Adjust for speed
-            estimated_duration = base_duration / speed
-
-            # Add buffer for natural pauses and pronunciation
-            estimated_duration *= 1.2
-
-            return max(1.0, estimated_duration)  # Minimum 1 second
+            word_count = sum(1 for _ in _WORD_RE.finditer(text))
+            return _estimate_duration(word_count, speed)
 
         except Exception:
             return 5.0  # Default fallback
@@ -261,8 +382,8 @@ class OpenAITTS(LoggerMixin):
             file_path = Path(filename)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, 'wb') as f:
-                f.write(audio_data)
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(audio_data)
 
             self.logger.info("Audio saved to file", filepath=str(file_path), size=len(audio_data))
             return file_path
@@ -288,28 +409,33 @@ class OpenAITTS(LoggerMixin):
         Returns:
             URL to audio file for Twilio playback
         """
+        speed = 0.9  # Slightly slower for phone clarity
+
         try:
-            # Generate audio optimized for phone calls
-            audio_data = await self.synthesize_with_emotions(
-                text=text,
-                emotion=emotion,
-                voice=voice,
-                speed=0.9  # Slightly slower for phone clarity
-            )
+            # Identical phrases map to the same file, so repeats skip synthesis
+            digest = hashlib.sha256(f"{text}\0{voice}\0{emotion}\0{speed}".encode()).hexdigest()
+            audio_path = _TWILIO_AUDIO_DIR / f"{digest}.mp3"
+            loop = asyncio.get_running_loop()
 
-            # Save to temporary file (in production, upload to S3 or similar)
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix='.mp3',
-                delete=False,
-                prefix='tts_'
-            )
+            if not await loop.run_in_executor(None, self._touch_if_exists, audio_path):
+                # Generate audio optimized for phone calls
+                audio_data = await self.synthesize_with_emotions(
+                    text=text,
+                    emotion=emotion,
+                    voice=voice,
+                    speed=speed
+                )
 
-            temp_file.write(audio_data)
-            temp_file.close()
+                # Save to local cache (in production, upload to S3 or similar)
+                await loop.run_in_executor(None, self._write_audio_atomic, audio_path, audio_data)
+                eviction = loop.run_in_executor(
+                    None, self._evict_twilio_audio, _TWILIO_CACHE_MAX_BYTES
+                )
+                eviction.add_done_callback(self._report_eviction_error)
 
             # In production, you'd upload this to a CDN and return the public URL
             # For now, return the local file path
-            file_url = f"file://{temp_file.name}"
+            file_url = f"file://{audio_path}"
 
             self.logger.info(
                 "Audio response created for Twilio",
@@ -323,18 +449,110 @@ class OpenAITTS(LoggerMixin):
             self.logger.error("Failed to create Twilio audio response", error=str(e))
             raise TTSError(f"Failed to create audio response: {str(e)}")
 
-    def get_voice_info(self) -> Dict[str, str]:
-        """Get information about available voices."""
-        return self.voices.copy()
+    @staticmethod
+    def _touch_if_exists(path: Path) -> bool:
+        """Mark a cached clip as recently used; False if it is not cached."""
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _write_audio_atomic(path: Path, audio_data: bytes) -> None:
+        """Write audio via a temp file and rename, so readers never see partial clips."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False)
+        try:
+            with temp_file:
+                temp_file.write(audio_data)
+            os.replace(temp_file.name, path)
+        except BaseException:
+            # Eviction only counts finished clips, so a stray temp file would never go
+            try:
+                os.remove(temp_file.name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @staticmethod
+    def _evict_twilio_audio(max_bytes: int) -> None:
+        """Delete least recently used Twilio clips until the cache fits in max_bytes."""
+        try:
+            entries = []
+            total_size = 0
+            with os.scandir(_TWILIO_AUDIO_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith('.mp3'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total_size += stat.st_size
+
+            if total_size <= max_bytes:
+                return
+
+            for _, size, file_path in sorted(entries):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+                if total_size <= max_bytes:
+                    break
+
+        except OSError:
+            pass
+
+    def _report_eviction_error(self, eviction: "asyncio.Future[None]") -> None:
+        """Log a failed background eviction instead of leaving its exception unretrieved."""
+        if not eviction.cancelled() and eviction.exception() is not None:
+            self.logger.error("Twilio audio eviction failed", error=str(eviction.exception()))
+
+    def _cache_audio(self, cache_key: Tuple[str, str, str, float], audio_data: bytes) -> None:
+        """Store a clip in the LRU cache, evicting the oldest clips to stay within limits."""
+        if len(audio_data) > self._CACHE_MAX_CLIP_BYTES:
+            return
+
+        # Concurrent misses for the same text store it twice; count it once
+        previous = self._audio_cache.pop(cache_key, None)
+        if previous is not None:
+            self._audio_cache_bytes -= len(previous)
+
+        self._audio_cache[cache_key] = audio_data
+        self._audio_cache_bytes += len(audio_data)
+        while (len(self._audio_cache) > self._CACHE_MAX_ENTRIES
+               or self._audio_cache_bytes > self._CACHE_MAX_BYTES):
+            _, evicted = self._audio_cache.popitem(last=False)
+            self._audio_cache_bytes -= len(evicted)
+
+    @staticmethod
+    def _cache_key(
+            text: str,
+            voice: str,
+            response_format: str,
+            speed: float
+    ) -> Tuple[str, str, str, float]:
+        """Build a cache key that ignores whitespace differences.
+
+        Case is kept: TTS speaks "US"/"us" or "May"/"may" differently.
+        """
+        return " ".join(text.split()), voice, response_format, speed
+
+    def get_voice_info(self) -> Mapping[str, str]:
+        """Get read-only information about available voices."""
+        return self.VOICES
 
     async def health_check(self) -> bool:
         """Check if OpenAI TTS service is available."""
         try:
-            # Test with minimal text
-            test_audio = await self.synthesize_speech(
-                text="Hello",
-                voice="nova"
+            # Call the API directly so the probe neither hits nor evicts cached audio
+            response = await self.client.audio.speech.create(
+                model=self.MODEL,
+                voice="nova",
+                input="Hello",
+                response_format="mp3"
             )
+            test_audio = await _drain_bytes(response.iter_bytes())
             return len(test_audio) > 0
 
         except Exception as e:
@@ -1,12 +1,16 @@
 """Configuration management using Pydantic Settings."""
 
 from functools import lru_cache
-from typing import Optional, List
-import os
+from typing import Optional, List, Tuple, Union
 
-from pydantic import Field
+from dotenv import load_dotenv
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Read .env into the process environment once; every Settings class then reads
+# os.environ instead of re-parsing the file on each instantiation.
+load_dotenv(".env", override=False)
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
@@ -16,12 +20,6 @@ class DatabaseSettings(BaseSettings):
     pool_size: int = Field(10, description="Database connection pool size")
     max_overflow: int = Field(20, description="Max overflow connections")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class JWTSettings(BaseSettings):
     """JWT configuration."""
@@ -32,12 +30,6 @@ class JWTSettings(BaseSettings):
     algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     expiration_hours: int = Field(24, alias="JWT_EXPIRATION_HOURS")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class RedisSettings(BaseSettings):
     """Redis configuration."""
@@ -45,12 +37,6 @@ class RedisSettings(BaseSettings):
     session_db: int = Field(1, alias="REDIS_SESSION_DB")
     max_connections: int = Field(20)
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class TwilioSettings(BaseSettings):
     """Twilio configuration."""
@@ -59,12 +45,6 @@ class TwilioSettings(BaseSettings):
     phone_number: str = Field(default="", alias="TWILIO_PHONE_NUMBER")
     webhook_base_url: Optional[str] = Field(None, description="Base URL for webhooks")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class APISettings(BaseSettings):
     """API server configuration."""
@@ -74,22 +54,21 @@ class APISettings(BaseSettings):
     title: str = Field("AI Calling Agent API")
     version: str = Field("1.0.0", alias="API_VERSION")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class LoggingSettings(BaseSettings):
     """Logging configuration."""
     level: str = Field("INFO", alias="LOG_LEVEL")
     format: str = Field("json", alias="LOG_FORMAT")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
+
+class TTSSettings(BaseSettings):
+    """Text-to-Speech configuration."""
+    twilio_cache_max_mb: int = Field(200, alias="TTS_TWILIO_CACHE_MAX_MB")
+    memory_cache_max_mb: int = Field(32, alias="TTS_MEMORY_CACHE_MAX_MB")
+    # JSON list of [text, voice, emotion] synthesized at startup
+    warmup_phrases: List[Tuple[str, str, str]] = Field(
+        default_factory=list,
+        alias="TTS_WARMUP_PHRASES"
     )
 
 
@@ -98,19 +77,11 @@ class ExternalAPISettings(BaseSettings):
     openai_api_key: Optional[str] = Field(None, alias="OPENAI_API_KEY")
     elevenlabs_api_key: Optional[str] = Field(None, alias="ELEVENLABS_API_KEY")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore"
-    )
-
 
 class Settings(BaseSettings):
     """Main application settings."""
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore"
     )
@@ -128,17 +99,20 @@ class Settings(BaseSettings):
     api: APISettings = Field(default_factory=APISettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     external_apis: ExternalAPISettings = Field(default_factory=ExternalAPISettings)
-    cors_origins: List[str] = Field(
+    tts: TTSSettings = Field(default_factory=TTSSettings)
+    # Accepts a JSON list or a comma-separated string; always validated to a list
+    cors_origins: Union[List[str], str] = Field(
         default=["http://localhost:3000", "http://localhost:3001"],
         alias="CORS_ORIGINS"
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Parse CORS_ORIGINS if it's a string
-        cors_env = os.getenv("CORS_ORIGINS")
-        if cors_env:
-            self.cors_origins = [origin.strip() for origin in cors_env.split(",")]
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_cors(cls, value):
+        """Parse comma-separated CORS origins from the environment."""
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",")]
+        return value
 
 
 @lru_cache()
@@ -6,6 +6,8 @@ from typing import Any, Dict, Optional
 class AICallingAgentException(Exception):
     """Base exception for AI calling agent."""
 
+    __slots__ = ("message", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -17,6 +19,16 @@ class AICallingAgentException(Exception):
         self.details = details or {}
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # Slot values are not in __dict__, so pass them explicitly for copy/pickle
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return self.__class__, self.args, state
+
 
 # ============================================
 # CONFIGURATION & SYSTEM ERRORS
@@ -24,12 +36,14 @@ class AICallingAgentException(Exception):
 
 class ConfigurationError(AICallingAgentException):
     """Raised when configuration is invalid."""
-    pass
+
+    __slots__ = ()
 
 
 class DatabaseError(AICallingAgentException):
     """Raised when database operation fails."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -38,27 +52,32 @@ class DatabaseError(AICallingAgentException):
 
 class AuthenticationError(AICallingAgentException):
     """Raised when authentication fails."""
-    pass
+
+    __slots__ = ()
 
 
 class AuthorizationError(AICallingAgentException):
     """Raised when authorization fails."""
-    pass
+
+    __slots__ = ()
 
 
 class InvalidCredentialsError(AuthenticationError):
     """Raised when login credentials are invalid."""
-    pass
+
+    __slots__ = ()
 
 
 class TokenExpiredError(AuthenticationError):
     """Raised when JWT token has expired."""
-    pass
+
+    __slots__ = ()
 
 
 class InvalidTokenError(AuthenticationError):
     """Raised when JWT token is invalid."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -67,22 +86,26 @@ class InvalidTokenError(AuthenticationError):
 
 class UserError(AICallingAgentException):
     """Base exception for user-related errors."""
-    pass
+
+    __slots__ = ()
 
 
 class UserNotFoundError(UserError):
     """Raised when user is not found."""
-    pass
+
+    __slots__ = ()
 
 
 class UserAlreadyExistsError(UserError):
     """Raised when trying to create a user that already exists."""
-    pass
+
+    __slots__ = ()
 
 
 class UserInactiveError(UserError):
     """Raised when user account is inactive."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -91,32 +114,38 @@ class UserInactiveError(UserError):
 
 class TelephonyError(AICallingAgentException):
     """Base class for telephony-related errors."""
-    pass
+
+    __slots__ = ()
 
 
 class TwilioError(TelephonyError):
     """Raised when Twilio API calls fail."""
-    pass
+
+    __slots__ = ()
 
 
 class CallError(TelephonyError):
     """Raised when call operations fail."""
-    pass
+
+    __slots__ = ()
 
 
 class CallNotFoundError(CallError):
     """Raised when call is not found."""
-    pass
+
+    __slots__ = ()
 
 
 class CallAlreadyInProgressError(CallError):
     """Raised when trying to start a call that's already in progress."""
-    pass
+
+    __slots__ = ()
 
 
 class InvalidCallStateError(CallError):
     """Raised when call is in invalid state for operation."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -125,17 +154,20 @@ class InvalidCallStateError(CallError):
 
 class SessionError(AICallingAgentException):
     """Raised when session operations fail."""
-    pass
+
+    __slots__ = ()
 
 
 class SessionNotFoundError(SessionError):
     """Raised when session is not found."""
-    pass
+
+    __slots__ = ()
 
 
 class SessionExpiredError(SessionError):
     """Raised when session has expired."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -144,27 +176,32 @@ class SessionExpiredError(SessionError):
 
 class AIServiceError(AICallingAgentException):
     """Base class for AI service errors."""
-    pass
+
+    __slots__ = ()
 
 
 class STTError(AIServiceError):
     """Raised when Speech-to-Text operations fail."""
-    pass
+
+    __slots__ = ()
 
 
 class TTSError(AIServiceError):
     """Raised when Text-to-Speech operations fail."""
-    pass
+
+    __slots__ = ()
 
 
 class NLPError(AIServiceError):
     """Raised when NLP processing fails."""
-    pass
+
+    __slots__ = ()
 
 
 class LLMError(NLPError):
     """Raised when LLM API calls fail."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -173,12 +210,14 @@ class LLMError(NLPError):
 
 class IntegrationError(AICallingAgentException):
     """Raised when external integration fails."""
-    pass
+
+    __slots__ = ()
 
 
 class CRMError(IntegrationError):
     """Raised when CRM integration fails."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -187,17 +226,20 @@ class CRMError(IntegrationError):
 
 class ValidationError(AICallingAgentException):
     """Raised when data validation fails."""
-    pass
+
+    __slots__ = ()
 
 
 class DataFormatError(ValidationError):
     """Raised when data format is invalid."""
-    pass
+
+    __slots__ = ()
 
 
 class MissingDataError(ValidationError):
     """Raised when required data is missing."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -206,7 +248,8 @@ class MissingDataError(ValidationError):
 
 class RateLimitError(AICallingAgentException):
     """Raised when rate limit is exceeded."""
-    pass
+
+    __slots__ = ()
 
 
 # ============================================
@@ -216,13 +259,18 @@ class RateLimitError(AICallingAgentException):
 class BulkOperationError(AICallingAgentException):
     """Raised when bulk operations fail."""
 
+    __slots__ = ("failed_items", "successful_items", "results")
+
     def __init__(
         self,
         message: str,
         failed_items: Optional[list] = None,
         successful_items: Optional[list] = None,
+        results: Optional[dict] = None,
         **kwargs,
     ):
         super().__init__(message, **kwargs)
         self.failed_items = failed_items or []
-        self.successful_items = successful_items or []
\ No newline at end of file
+        self.successful_items = successful_items or []
+        # Output of the items that succeeded, so callers can still use it
+        self.results = results or {}
\ No newline at end of file
@@ -1,9 +1,16 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+import traceback
+from typing import Any, BinaryIO, ClassVar, Dict, List, Optional, Tuple
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
@@ -12,87 +19,256 @@ from .config import get_settings
 
 settings = get_settings()
 
+# Drains queued stdlib records to the real handler on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Third-party loggers held above the application level
+_NOISY_LOGGERS: Dict[str, int] = {
+    "uvicorn.access": logging.WARNING,
+    "sqlalchemy.engine": logging.INFO if settings.database.echo else logging.WARNING,
+}
+
+
+# Only these methods are expected to carry exc_info/stack_info
+_ERROR_METHODS = frozenset({"error", "exception", "critical", "fatal"})
+_STACK_INFO_RENDERER = structlog.processors.StackInfoRenderer()
+
+
+def _render_error_details(
+    logger: Any, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Render stack and exception info, skipping the work for non-error records."""
+    if method_name not in _ERROR_METHODS:
+        return event_dict
+    event_dict = _STACK_INFO_RENDERER(logger, method_name, event_dict)
+    return structlog.processors.format_exc_info(logger, method_name, event_dict)
+
+
+def _rename_logger_name(
+    logger: Any, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Emit the name bound by get_logger() under "logger", as add_logger_name did."""
+    name = event_dict.pop("logger_name", None)
+    if name is not None:
+        event_dict["logger"] = name
+    return event_dict
+
+
+def _stop_queue_listener() -> None:
+    """Stop the stdlib queue listener, flushing any pending records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging() -> None:
     """Configure structured logging with rich formatting."""
+    log_level = getattr(logging, settings.logging.level.upper())
 
     # Configure structlog processors based on environment
     processors = [
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
+        # Buffered and direct loggers reach stdout at different times; the
+        # timestamp keeps the real order recoverable
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        _rename_logger_name,
+        _render_error_details,
     ]
 
-    # Add format-specific processor
+    # Add format-specific processor. JSON output is written straight to stdout,
+    # bypassing stdlib logging; the console format goes through stdlib handlers.
     if settings.logging.format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = structlog.BytesLoggerFactory(file=sys.stdout.buffer)
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
+        logger_factory = structlog.stdlib.LoggerFactory()
 
     # Configure structlog
     structlog.configure(
         processors=processors,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=logger_factory,
+        # Calls below the configured level return immediately, before any processing
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
-    handlers = []
+    # Configure standard library logging (third-party loggers, console format).
+    # Calling this again replaces the previous handlers and listener.
+    global _queue_listener
+    _stop_queue_listener()
 
-    if settings.logging.format != "json":
-        handlers.append(
-            RichHandler(
-                console=Console(stderr=False),
-                rich_tracebacks=True,
-                tracebacks_show_locals=settings.api.debug,
-            )
+    if settings.api.debug and settings.logging.format != "json":
+        # Attached directly: QueueHandler.prepare() drops exc_info, which
+        # RichHandler needs to render tracebacks
+        root_handler = RichHandler(
+            console=Console(stderr=False),
+            rich_tracebacks=True,
+            tracebacks_show_locals=True,
         )
     else:
-        handlers.append(logging.StreamHandler(sys.stdout))
+        # Records are enqueued on the calling thread and written by a listener thread
+        log_queue = queue.SimpleQueue()
+        root_handler = logging.handlers.QueueHandler(log_queue)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, logging.StreamHandler(sys.stdout), respect_handler_level=True
+        )
+        _queue_listener.start()
 
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.logging.level.upper()),
-        handlers=handlers,
+        level=log_level,
+        handlers=[root_handler],
+        force=True,
     )
 
     # Set specific logger levels
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine").setLevel(
-        logging.INFO if settings.database.echo else logging.WARNING
-    )
+    for name, level in _NOISY_LOGGERS.items():
+        logging.getLogger(name).setLevel(level)
 
 
-def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: Optional[str] = None) -> structlog.typing.FilteringBoundLogger:
     """Get a configured logger instance."""
-    return structlog.get_logger(name)
+    if name is None:
+        return structlog.get_logger()
+    # Bind the name explicitly: the JSON path has no stdlib logger to read it from.
+    # ("logger" itself would clash with wrap_logger's own parameter.)
+    return structlog.get_logger(name, logger_name=name)
+
+
+class _ThreadLocalBufferedWriter:
+    """
+    Byte sink that buffers writes per thread and flushes them in the background.
+
+    Emitting threads only append to their own buffer, so they never contend on
+    stdout. A daemon thread writes all buffers out every ``flush_interval``
+    seconds; a buffer that grows past ``buffer_size`` bytes is written inline.
+    Buffers of threads that have exited are dropped once drained.
+    """
+
+    def __init__(self, target: BinaryIO, flush_interval: float = 0.05, buffer_size: int = 8192):
+        self._target = target
+        self._flush_interval = flush_interval
+        self._buffer_size = buffer_size
+        self._local = threading.local()
+        self._buffers: List[Tuple[threading.Thread, threading.Lock, bytearray]] = []
+        self._registry_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+
+    def write(self, data: bytes) -> None:
+        """Append data to the calling thread's buffer."""
+        lock, buffer = self._thread_buffer()
+        with lock:
+            buffer.extend(data)
+            if len(buffer) < self._buffer_size:
+                return
+            chunk = bytes(buffer)
+            buffer.clear()
+        self._emit(chunk)
+
+    def flush(self) -> None:
+        """No-op; BytesLogger flushes after every record, draining happens in the background."""
+
+    def drain(self) -> None:
+        """Write out every thread's pending bytes and drop buffers of exited threads."""
+        with self._registry_lock:
+            entries = list(self._buffers)
+        finished = []
+        for entry in entries:
+            thread, lock, buffer = entry
+            # Checked before draining: an exited thread cannot refill its buffer
+            if not thread.is_alive():
+                finished.append(entry)
+            with lock:
+                if not buffer:
+                    continue
+                chunk = bytes(buffer)
+                buffer.clear()
+            self._emit(chunk)
+        if finished:
+            with self._registry_lock:
+                self._buffers = [entry for entry in self._buffers if entry not in finished]
+
+    def _thread_buffer(self) -> Tuple[threading.Lock, bytearray]:
+        entry = getattr(self._local, "entry", None)
+        if entry is None:
+            entry = (threading.Lock(), bytearray())
+            with self._registry_lock:
+                self._buffers.append((threading.current_thread(), *entry))
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._run, name="log-flusher", daemon=True
+                    )
+                    self._flusher.start()
+            self._local.entry = entry
+        return entry
+
+    def _emit(self, chunk: bytes) -> None:
+        with self._write_lock:
+            self._target.write(chunk)
+            self._target.flush()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._flush_interval)
+            try:
+                self.drain()
+            except Exception:
+                # Report and keep going, as logging.Handler.handleError does;
+                # a failed write must not stop later records from being flushed
+                traceback.print_exc(file=sys.stderr)
+
+
+# Named loggers for the helpers below, resolved once instead of per call
+_FUNC_LOGGER = get_logger("function_calls")
+
+# Call events and API requests are the highest-volume loggers; in JSON mode
+# they write through per-thread buffers instead of directly to stdout.
+if settings.logging.format == "json":
+    _buffered_stdout = _ThreadLocalBufferedWriter(sys.stdout.buffer)
+    atexit.register(_buffered_stdout.drain)
+    _API_LOGGER = structlog.wrap_logger(
+        structlog.BytesLogger(_buffered_stdout), logger_name="api_requests"
+    )
+    _CALL_LOGGER = structlog.wrap_logger(
+        structlog.BytesLogger(_buffered_stdout), logger_name="call_events"
+    )
+else:
+    _API_LOGGER = get_logger("api_requests")
+    _CALL_LOGGER = get_logger("call_events")
+
+_ERROR_LOGGER = get_logger("errors")
+_AUTH_LOGGER = get_logger("auth")
 
 
 class LoggerMixin:
     """Mixin to add logging capabilities to classes."""
 
-    @property
-    def logger(self) -> structlog.stdlib.BoundLogger:
-        """Get logger bound to this class."""
-        return get_logger(self.__class__.__name__)
+    __slots__ = ()
+
+    logger: ClassVar[structlog.typing.FilteringBoundLogger]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Bind a logger to each subclass once, at class creation."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
 
 
 def log_function_call(func_name: str, **kwargs: Any) -> None:
     """Log function call with parameters."""
-    logger = get_logger("function_calls")
-    logger.info(f"Calling {func_name}", **kwargs)
+    _FUNC_LOGGER.info("function_call", func=func_name, **kwargs)
 
 
 def log_api_request(method: str, path: str, **extra: Any) -> None:
     """Log API request details."""
-    logger = get_logger("api_requests")
-    logger.info("API request", method=method, path=path, **extra)
+    _API_LOGGER.info("API request", method=method, path=path, **extra)
 
 
 def log_call_event(
@@ -103,30 +279,35 @@ def log_call_event(
     **extra: Any
 ) -> None:
     """Log telephony call events."""
-    logger = get_logger("call_events")
-    logger.info(
-        "Call event",
-        call_sid=call_sid,
-        event_type=event_type,
-        status=status,
-        direction=direction,
-        **extra
-    )
+    payload = {"call_sid": call_sid, "event_type": event_type}
+    if status is not None:
+        payload["status"] = status
+    if direction is not None:
+        payload["direction"] = direction
+    payload.update(extra)
+    _CALL_LOGGER.info("Call event", **payload)
 
 
 def log_error(error: Exception, context: Optional[Dict[str, Any]] = None) -> None:
     """Log error with context."""
-    logger = get_logger("errors")
-    logger.error(
-        "Error occurred",
-        error_type=error.__class__.__name__,
-        error_message=str(error),
-        context=context or {},
-        exc_info=True,
-    )
+    error_type = type(error).__name__
+    try:
+        error_message = str(error)
+    except Exception:
+        # A broken __str__ must not hide the error being reported
+        error_message = f"<unprintable {error_type}>"
+
+    payload = {
+        "error_type": error_type,
+        "error_message": error_message,
+        "context": context or {},
+    }
+    # Only raised errors have a traceback worth rendering
+    if error.__traceback__ is not None:
+        payload["exc_info"] = error
+    _ERROR_LOGGER.error("Error occurred", **payload)
 
 
 def log_auth_event(event_type: str, email: Optional[str] = None, **extra: Any) -> None:
     """Log authentication events."""
-    logger = get_logger("auth")
-    logger.info("Auth event", event_type=event_type, email=email, **extra)
\ No newline at end of file
+    _AUTH_LOGGER.info("Auth event", event_type=event_type, email=email, **extra)
\ No newline at end of file
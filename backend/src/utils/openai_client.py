@@ -0,0 +1,24 @@
+"""Shared OpenAI client for the AI services."""
+
+from functools import lru_cache
+
+from openai import AsyncOpenAI
+
+from .config import get_settings
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache()
+def get_openai_client() -> AsyncOpenAI:
+    """Get the cached OpenAI client shared by STT, TTS and NLP."""
+    return AsyncOpenAI(api_key=get_settings().external_apis.openai_api_key)
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client if it was created; the next lookup builds a new one."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+        logger.info("OpenAI client closed")
@@ -9,34 +9,47 @@ from pathlib import Path
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-import uvicorn
+import structlog
+from sqlalchemy import text
+
 from src.utils.config import get_settings
 from src.utils.logger import setup_logging, get_logger
 
 # Initialize settings and logging
 settings = get_settings()
 setup_logging()
+# Fields that never change for this process, attached to every record
+structlog.contextvars.bind_contextvars(
+    pid=os.getpid(),
+    env=settings.environment,
+    version=settings.api.version,
+)
 logger = get_logger(__name__)
 
 
-async def check_dependencies():
-    """Check if all required dependencies and services are available."""
-    logger.info("Checking dependencies...")
+# Upper bound for each startup probe, in seconds
+_PROBE_TIMEOUT = 5.0
 
-    # Check database connection
-    try:
-        from src.core.database import db_manager
-        db_manager.init_db()
+_PING = text("SELECT 1")
 
-        async with db_manager.get_session() as session:
-            await session.execute("SELECT 1")
+# Working directories created at startup
+_DIRS = ("logs", "temp_audio", "uploads", "backups")
 
-        logger.info("Database connection successful")
-    except Exception as e:
-        logger.error("Database connection failed", error=str(e))
-        return False
 
-    # Check external API keys
+async def _check_db() -> None:
+    """Open a session and run a trivial query."""
+    from src.core.database import db_manager
+    db_manager.init_db()
+
+    async with db_manager.get_session() as session:
+        await session.execute(_PING)
+
+
+async def check_dependencies():
+    """Check if all required dependencies and services are available."""
+    logger.info("Checking dependencies...")
+
+    # Check external API keys (no I/O, so before any probe is started)
     missing_keys = []
 
     if not settings.external_apis.openai_api_key:
@@ -51,6 +64,10 @@ async def check_dependencies():
             logger.error("Cannot start in production without required API keys")
             return False
 
+    # Run the database check and service health checks concurrently
+    db_probe = asyncio.ensure_future(asyncio.wait_for(_check_db(), _PROBE_TIMEOUT))
+
+    service_probes = {}
     # Test external services (optional in development)
     if settings.environment == "production":
         try:
@@ -58,59 +75,81 @@ async def check_dependencies():
             from src.tts.openai_tts import openai_tts
             from src.nlp.openai_nlp import openai_nlp
 
-            # Quick health checks
-            services_ok = await asyncio.gather(
-                openai_stt.health_check(),
-                openai_tts.health_check(),
-                openai_nlp.health_check(),
-                return_exceptions=True
-            )
-
-            for i, service in enumerate(['STT', 'TTS', 'NLP']):
-                if isinstance(services_ok[i], Exception) or not services_ok[i]:
-                    logger.warning(f"{service} service health check failed")
-                else:
-                    logger.info(f"{service} service healthy")
-
+            for name, service in (("STT", openai_stt), ("TTS", openai_tts), ("NLP", openai_nlp)):
+                service_probes[name] = asyncio.ensure_future(
+                    asyncio.wait_for(service.health_check(), _PROBE_TIMEOUT)
+                )
         except Exception as e:
             logger.warning("Service health checks failed", error=str(e))
 
+    try:
+        await db_probe
+        logger.info("Database connection successful")
+    except Exception as e:
+        # The database is required; don't wait on the remaining probes
+        for probe in service_probes.values():
+            probe.cancel()
+        await asyncio.gather(*service_probes.values(), return_exceptions=True)
+        logger.error("Database connection failed", error=str(e) or type(e).__name__)
+        return False
+
+    results = await asyncio.gather(*service_probes.values(), return_exceptions=True)
+    for service, result in zip(service_probes, results):
+        if isinstance(result, BaseException) or not result:
+            logger.warning("Service health check failed", service=service)
+        else:
+            logger.info("Service healthy", service=service)
+
     return True
 
 
 def create_directories():
     """Create necessary directories."""
-    directories = [
-        "logs",
-        "temp_audio",
-        "uploads",
-        "backups"
-    ]
-
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+    for directory in _DIRS:
+        os.makedirs(directory, exist_ok=True)
 
     logger.info("Directories created/verified")
 
 
-def setup_signal_handlers():
-    """Setup graceful shutdown signal handlers."""
+def setup_signal_handlers(shutdown: asyncio.Event, force_shutdown: asyncio.Event):
+    """Setup graceful shutdown signal handlers; a second signal forces the exit."""
     import signal
 
-    def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        sys.exit(0)
+    loop = asyncio.get_running_loop()
+
+    def signal_handler(signum):
+        if shutdown.is_set():
+            if not force_shutdown.is_set():
+                logger.warning("Received signal again, forcing shutdown...", signal=signum)
+            force_shutdown.set()
+            return
+        logger.info("Received signal, initiating graceful shutdown...", signal=signum)
+        shutdown.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, signal_handler, signum)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(
+                signum, lambda s, _frame: loop.call_soon_threadsafe(signal_handler, s)
+            )
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+
+async def _stop_on(shutdown: asyncio.Event, force_shutdown: asyncio.Event, server) -> None:
+    """Ask the server to exit once shutdown is requested, and force it on a repeat."""
+    await shutdown.wait()
+    server.should_exit = True
+    await force_shutdown.wait()
+    server.force_exit = True
 
 
 async def main():
     """Main startup function."""
+    import uvicorn
+
     logger.info(
         "Starting AI Calling Agent Backend",
-        version=settings.api.version,
-        environment=settings.environment,
         debug=settings.api.debug
     )
 
@@ -118,7 +157,9 @@ async def main():
     create_directories()
 
     # Setup signal handlers for graceful shutdown
-    setup_signal_handlers()
+    shutdown = asyncio.Event()
+    force_shutdown = asyncio.Event()
+    setup_signal_handlers(shutdown, force_shutdown)
 
     # Check dependencies
     if not await check_dependencies():
@@ -151,6 +192,9 @@ async def main():
     )
 
     server = uvicorn.Server(config)
+    # Signals are handled above; keep uvicorn from replacing those handlers
+    server.install_signal_handlers = lambda: None
+    stopper = asyncio.create_task(_stop_on(shutdown, force_shutdown, server))
 
     try:
         logger.info("Server starting...")
@@ -161,11 +205,14 @@ async def main():
         logger.error("Server error", error=str(e), exc_info=True)
         sys.exit(1)
     finally:
+        stopper.cancel()
         logger.info("Server shutdown complete")
 
 
 def run_development():
     """Run in development mode with auto-reload."""
+    import uvicorn
+
     logger.info("Starting development server with auto-reload...")
 
     uvicorn.run(
@@ -181,6 +228,8 @@ def run_development():
 
 def run_production():
     """Run in production mode."""
+    import uvicorn
+
     logger.info("Starting production server...")
 
     # In production, you might want to use gunicorn instead
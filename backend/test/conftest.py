@@ -1,14 +1,25 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+import pytest_asyncio
 import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 from typing import AsyncGenerator
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+try:
+    import uvloop
+except ImportError:  # uvloop (via uvicorn[standard]) is not available on Windows
+    uvloop = None
+
+# Make the backend package (``src.*``) importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Set test environment
 os.environ['TESTING'] = 'true'
@@ -19,16 +30,36 @@ pytest_plugins = ('pytest_asyncio',)
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-    """Create event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Event loop policy for the test session: uvloop where available."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest.fixture
-async def mock_db_session():
-    """Mock database session."""
+@pytest.fixture(scope='session')
+def app():
+    """FastAPI app, imported on first use rather than at collection."""
+    from src.app import app
+    return app
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    """Test client fixture, shared by the whole session."""
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope='session')
+async def async_client(app):
+    """Async test client fixture, shared by the whole session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+@pytest.fixture(scope='session')
+def _db_session_prototype():
+    """Mock database session, built once per session."""
     session = AsyncMock()
     session.add = MagicMock()
     session.commit = AsyncMock()
@@ -40,6 +71,22 @@ async def mock_db_session():
     return session
 
 
+@pytest.fixture
+def mock_db_session(_db_session_prototype, monkeypatch):
+    """Mock database session, handed out by db_manager.get_session()."""
+    from src.core.database import db_manager
+
+    session = _db_session_prototype
+    session.reset_mock(return_value=True, side_effect=True)
+
+    @asynccontextmanager
+    async def get_session():
+        yield session
+
+    monkeypatch.setattr(db_manager, 'get_session', get_session)
+    return session
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings for testing."""
@@ -57,67 +104,101 @@ def mock_settings():
     return settings
 
 
+@pytest.fixture(scope='session')
+def mock_call_template():
+    """Default attributes for mock call objects."""
+    return MappingProxyType({
+        'id': '123e4567-e89b-12d3-a456-426614174000',
+        'call_sid': 'test_call_sid',
+        'to_number': '+1234567890',
+        'from_number': '+0987654321',
+        'status': 'queued',
+        'direction': 'outbound',
+        'contact_id': None,
+        'campaign_id': None,
+        'duration_seconds': None,
+        'answered_at': None,
+        'ended_at': None,
+        'cost': None,
+        'transcript': None,
+        'conversation_summary': None,
+        'sentiment_score': None,
+        'intent_detected': None,
+        'error_message': None,
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+        'started_at': None,
+    })
+
+
 @pytest.fixture
-def mock_call():
+def make_mock_call(mock_call_template):
+    """Factory for mock call objects; keyword arguments override the template."""
+    from src.core.database import Call
+
+    def _make(**overrides):
+        call = MagicMock(spec=Call)
+        call.configure_mock(**{**mock_call_template, **overrides})
+        return call
+
+    return _make
+
+
+@pytest.fixture
+def mock_call(mock_call_template):
     """Mock call object."""
     call = MagicMock()
-    call.id = '123e4567-e89b-12d3-a456-426614174000'
-    call.call_sid = 'test_call_sid'
-    call.to_number = '+1234567890'
-    call.from_number = '+0987654321'
-    call.status = 'queued'
-    call.direction = 'outbound'
-    call.contact_id = None
-    call.campaign_id = None
-    call.duration_seconds = None
-    call.answered_at = None
-    call.ended_at = None
-    call.cost = None
-    call.transcript = None
-    call.conversation_summary = None
-    call.sentiment_score = None
-    call.intent_detected = None
-    call.error_message = None
-    call.created_at = '2024-01-01T00:00:00'
-    call.updated_at = '2024-01-01T00:00:00'
-    call.started_at = None
-
+    call.configure_mock(**mock_call_template)
     return call
 
 
+@pytest.fixture(scope='session')
+def mock_contact_template():
+    """Default attributes for mock contact objects."""
+    return MappingProxyType({
+        'id': '123e4567-e89b-12d3-a456-426614174001',
+        'phone_number': '+1234567890',
+        'first_name': 'John',
+        'last_name': 'Doe',
+        'email': 'john.doe@example.com',
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+    })
+
+
 @pytest.fixture
-def mock_contact():
+def mock_contact(mock_contact_template):
     """Mock contact object."""
     contact = MagicMock()
-    contact.id = '123e4567-e89b-12d3-a456-426614174001'
-    contact.phone_number = '+1234567890'
-    contact.first_name = 'John'
-    contact.last_name = 'Doe'
-    contact.email = 'john.doe@example.com'
-    contact.metadata = {}
-    contact.created_at = '2024-01-01T00:00:00'
-    contact.updated_at = '2024-01-01T00:00:00'
-
+    # metadata is mutable, so every test gets its own dict
+    contact.configure_mock(**mock_contact_template, metadata={})
     return contact
 
 
+@pytest.fixture(scope='session')
+def mock_campaign_template():
+    """Default attributes for mock campaign objects."""
+    return MappingProxyType({
+        'id': '123e4567-e89b-12d3-a456-426614174002',
+        'name': 'Test Campaign',
+        'description': 'Test campaign description',
+        'status': 'draft',
+        'script': 'Hello, this is a test call.',
+        'max_concurrent_calls': 5,
+        'retry_attempts': 3,
+        'total_contacts': 0,
+        'calls_completed': 0,
+        'calls_failed': 0,
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+    })
+
+
 @pytest.fixture
-def mock_campaign():
+def mock_campaign(mock_campaign_template):
     """Mock campaign object."""
     campaign = MagicMock()
-    campaign.id = '123e4567-e89b-12d3-a456-426614174002'
-    campaign.name = 'Test Campaign'
-    campaign.description = 'Test campaign description'
-    campaign.status = 'draft'
-    campaign.script = 'Hello, this is a test call.'
-    campaign.max_concurrent_calls = 5
-    campaign.retry_attempts = 3
-    campaign.total_contacts = 0
-    campaign.calls_completed = 0
-    campaign.calls_failed = 0
-    campaign.created_at = '2024-01-01T00:00:00'
-    campaign.updated_at = '2024-01-01T00:00:00'
-
+    campaign.configure_mock(**mock_campaign_template)
     return campaign
 
 
@@ -171,9 +252,9 @@ async def mock_session_manager():
     return session_manager
 
 
-@pytest.fixture
-async def mock_openai_services():
-    """Mock all OpenAI services."""
+@pytest.fixture(scope='session')
+def _openai_services_prototype():
+    """Mock OpenAI services, built once per session."""
 
     # Mock STT
     mock_stt = AsyncMock()
@@ -221,8 +302,17 @@ async def mock_openai_services():
 
 
 @pytest.fixture
-async def mock_twilio_client():
-    """Mock Twilio client."""
+def mock_openai_services(_openai_services_prototype):
+    """Mock all OpenAI services, with call history cleared for each test."""
+    for service in _openai_services_prototype.values():
+        # The fixed return values are kept; calls, awaits and side effects are not
+        service.reset_mock(side_effect=True)
+    return _openai_services_prototype
+
+
+@pytest.fixture(scope='session')
+def _twilio_client_prototype():
+    """Mock Twilio client, built once per session."""
     mock_client = AsyncMock()
 
     mock_client.make_call.return_value = {
@@ -261,6 +351,14 @@ async def mock_twilio_client():
     return mock_client
 
 
+@pytest.fixture
+def mock_twilio_client(_twilio_client_prototype):
+    """Mock Twilio client, with call history cleared for each test."""
+    # The fixed return values are kept; calls, awaits and side effects are not
+    _twilio_client_prototype.reset_mock(side_effect=True)
+    return _twilio_client_prototype
+
+
 @pytest.fixture
 async def mock_crm_integration():
     """Mock CRM integration."""
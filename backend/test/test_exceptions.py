@@ -0,0 +1,41 @@
+"""Tests for the custom exception hierarchy."""
+
+import copy
+import pickle
+
+import pytest
+
+from src.utils.exceptions import BulkOperationError
+
+
+@pytest.fixture
+def bulk_error():
+    """Partially failed bulk operation with every slot populated."""
+    return BulkOperationError(
+        "Conversation synthesis partially failed",
+        failed_items=[(1, "Rate limited")],
+        successful_items=["part_0"],
+        results={"part_0": b"audio"},
+        code="TTS_PARTIAL",
+        details={"parts": 2},
+    )
+
+
+class TestExceptionCopying:
+    """Test that slot attributes survive pickling and copying."""
+
+    @pytest.mark.parametrize("clone", [
+        lambda error: pickle.loads(pickle.dumps(error)),
+        copy.copy,
+    ], ids=["pickle", "copy"])
+    def test_bulk_operation_error_round_trip(self, bulk_error, clone):
+        """Test that a BulkOperationError keeps every field through a round trip."""
+        restored = clone(bulk_error)
+
+        assert type(restored) is BulkOperationError
+        assert restored.message == "Conversation synthesis partially failed"
+        assert restored.code == "TTS_PARTIAL"
+        assert restored.details == {"parts": 2}
+        assert restored.failed_items == [(1, "Rate limited")]
+        assert restored.successful_items == ["part_0"]
+        assert restored.results == {"part_0": b"audio"}
@@ -0,0 +1,85 @@
+"""Tests for the per-thread buffered log writer."""
+
+import threading
+import time
+
+from src.utils.logger import _ThreadLocalBufferedWriter
+
+
+class RecordingTarget:
+    """Byte sink that records what reaches it; optionally fails the first write."""
+
+    def __init__(self, fail_first_write=False):
+        self.data = bytearray()
+        self.fail_next_write = fail_first_write
+
+    def write(self, chunk):
+        if self.fail_next_write:
+            self.fail_next_write = False
+            raise OSError("Broken pipe")
+        self.data.extend(chunk)
+
+    def flush(self):
+        pass
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestThreadLocalBufferedWriter:
+    """Test buffering, draining and recovery of the log writer."""
+
+    def test_inline_flush_past_buffer_size(self):
+        """Test that a buffer reaching buffer_size is written on the calling thread."""
+        target = RecordingTarget()
+        writer = _ThreadLocalBufferedWriter(target, flush_interval=60, buffer_size=16)
+
+        writer.write(b"0123456789")
+        assert target.data == b""
+
+        writer.write(b"abcdefghij")
+        assert target.data == b"0123456789abcdefghij"
+
+    def test_background_drain(self):
+        """Test that the flusher thread writes out small buffers."""
+        target = RecordingTarget()
+        writer = _ThreadLocalBufferedWriter(target, flush_interval=0.01)
+
+        writer.write(b'{"event":"Call event"}\n')
+
+        assert _wait_for(lambda: target.data == b'{"event":"Call event"}\n')
+
+    def test_drain_prunes_finished_threads(self):
+        """Test that a finished thread's bytes are written and its buffer dropped."""
+        target = RecordingTarget()
+        writer = _ThreadLocalBufferedWriter(target, flush_interval=60)
+
+        worker = threading.Thread(target=writer.write, args=(b"from worker\n",))
+        worker.start()
+        worker.join()
+        assert len(writer._buffers) == 1
+
+        writer.drain()
+
+        assert target.data == b"from worker\n"
+        assert writer._buffers == []
+
+    def test_flusher_survives_write_error(self, capsys):
+        """Test that a failed write is reported and later records still flush."""
+        target = RecordingTarget(fail_first_write=True)
+        writer = _ThreadLocalBufferedWriter(target, flush_interval=0.01)
+
+        writer.write(b"lost\n")
+        assert _wait_for(lambda: not target.fail_next_write)
+
+        writer.write(b"kept\n")
+        assert _wait_for(lambda: target.data == b"kept\n")
+        assert writer._flusher.is_alive()
+        assert "Broken pipe" in capsys.readouterr().err
@@ -0,0 +1,190 @@
+"""Tests for the OpenAI TTS service."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.tts.openai_tts import OpenAITTS
+from src.utils.exceptions import BulkOperationError, TTSError
+
+
+class FakeSpeechAPI:
+    """Stand-in for ``client.audio.speech``; returns the input text as audio bytes."""
+
+    def __init__(self):
+        self.inputs = []
+
+    async def create(self, *, input, **kwargs):
+        self.inputs.append(input)
+        audio = input.encode()
+
+        async def iter_bytes():
+            yield audio
+
+        return SimpleNamespace(iter_bytes=iter_bytes)
+
+
+@pytest.fixture
+def speech_api():
+    """Fake speech endpoint that records the texts it synthesized."""
+    return FakeSpeechAPI()
+
+
+@pytest.fixture
+def tts(speech_api, monkeypatch):
+    """TTS service talking to the fake speech endpoint."""
+    client = SimpleNamespace(audio=SimpleNamespace(speech=speech_api))
+    monkeypatch.setattr("src.tts.openai_tts.get_openai_client", lambda: client)
+    return OpenAITTS()
+
+
+@pytest.mark.asyncio
+class TestAudioCache:
+    """Test the in-memory cache of synthesized clips."""
+
+    async def test_cache_hit_skips_api(self, tts, speech_api):
+        """Test that repeating a phrase is served from the cache."""
+        first = await tts.synthesize_speech("Thank you for calling")
+        second = await tts.synthesize_speech("Thank you for calling")
+
+        assert first == second == b"Thank you for calling"
+        assert speech_api.inputs == ["Thank you for calling"]
+
+    async def test_key_collapses_whitespace_only(self, tts, speech_api):
+        """Test that whitespace variants share an entry but case variants do not."""
+        await tts.synthesize_speech("Call  the\tUS office")
+        await tts.synthesize_speech("Call the US office")
+        await tts.synthesize_speech("Call the us office")
+
+        assert speech_api.inputs == ["Call  the\tUS office", "Call the us office"]
+
+    async def test_evicts_oldest_over_byte_budget(self, tts, speech_api, monkeypatch):
+        """Test that the least recently used clips go once the byte budget is exceeded."""
+        monkeypatch.setattr(OpenAITTS, "_CACHE_MAX_BYTES", 10)
+
+        await tts.synthesize_speech("aaaa")
+        await tts.synthesize_speech("bbbb")
+        await tts.synthesize_speech("aaaa")  # Refresh "aaaa"
+        await tts.synthesize_speech("cccc")  # 12 bytes: evicts "bbbb"
+
+        await tts.synthesize_speech("aaaa")
+        await tts.synthesize_speech("bbbb")
+
+        assert speech_api.inputs == ["aaaa", "bbbb", "cccc", "bbbb"]
+        assert tts._audio_cache_bytes == sum(map(len, tts._audio_cache.values()))
+
+    async def test_skips_oversized_clips(self, tts, speech_api, monkeypatch):
+        """Test that a clip above the per-clip limit is returned but not cached."""
+        monkeypatch.setattr(OpenAITTS, "_CACHE_MAX_CLIP_BYTES", 4)
+
+        await tts.synthesize_speech("long clip")
+        await tts.synthesize_speech("long clip")
+
+        assert speech_api.inputs == ["long clip", "long clip"]
+        assert tts._audio_cache_bytes == 0
+
+
+@pytest.fixture
+def twilio_audio_dir(tmp_path, monkeypatch):
+    """Point the Twilio clip cache at a temporary directory."""
+    monkeypatch.setattr("src.tts.openai_tts._TWILIO_AUDIO_DIR", tmp_path)
+    return tmp_path
+
+
+class TestTwilioAudioCache:
+    """Test the on-disk cache of clips served to Twilio."""
+
+    @pytest.mark.asyncio
+    async def test_miss_writes_clip(self, tts, speech_api, twilio_audio_dir):
+        """Test that a new phrase is synthesized and written under its content hash."""
+        file_url = await tts.create_audio_response_for_twilio("Please hold", emotion="calm")
+
+        clip_path = Path(file_url.removeprefix("file://"))
+        assert clip_path.parent == twilio_audio_dir
+        assert clip_path.suffix == ".mp3"
+        assert clip_path.read_bytes() == b"Say this in a peaceful, relaxed manner: Please hold"
+        assert len(speech_api.inputs) == 1
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_synthesis(self, tts, speech_api, twilio_audio_dir):
+        """Test that a phrase already on disk is served without calling the API."""
+        first_url = await tts.create_audio_response_for_twilio("Please hold")
+
+        # A fresh instance has an empty memory cache, so only the disk can serve it
+        second_url = await OpenAITTS().create_audio_response_for_twilio("Please hold")
+
+        assert second_url == first_url
+        assert len(speech_api.inputs) == 1
+
+    def test_eviction_removes_least_recently_used(self, twilio_audio_dir):
+        """Test that the oldest clips go first until the cache fits the budget."""
+        for age, name in enumerate(["new", "middle", "old"]):
+            clip = twilio_audio_dir / f"{name}.mp3"
+            clip.write_bytes(b"x" * 10)
+            os.utime(clip, (1000 - age, 1000 - age))
+
+        OpenAITTS._evict_twilio_audio(max_bytes=20)
+
+        assert sorted(path.name for path in twilio_audio_dir.iterdir()) == [
+            "middle.mp3", "new.mp3"
+        ]
+
+    def test_failed_write_leaves_no_temp_file(self, twilio_audio_dir, monkeypatch):
+        """Test that the temp file is removed when the final rename fails."""
+        def fail_replace(src, dst):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+
+        with pytest.raises(OSError):
+            OpenAITTS._write_audio_atomic(twilio_audio_dir / "clip.mp3", b"audio")
+
+        assert list(twilio_audio_dir.iterdir()) == []
+
+
+@pytest.fixture
+def failing_parts(monkeypatch):
+    """Stub synthesize_with_emotions to fail on the texts added to the returned set."""
+    failing = set()
+
+    async def synthesize_with_emotions(self, text, emotion="neutral", voice="nova", speed=1.0):
+        if text in failing:
+            raise TTSError(f"Failed to synthesize speech: {text}")
+        return text.encode()
+
+    monkeypatch.setattr(OpenAITTS, "synthesize_with_emotions", synthesize_with_emotions)
+    return failing
+
+
+@pytest.mark.asyncio
+class TestConversationChunks:
+    """Test synthesis of multi-part conversations."""
+
+    async def test_all_parts_succeed(self, tts, failing_parts):
+        """Test that every part's audio is returned under its part ID."""
+        results = await tts.synthesize_conversation_chunks([{"text": "Hi"}, {"text": "Bye"}])
+
+        assert results == {"part_0": b"Hi", "part_1": b"Bye"}
+
+    async def test_partial_failure_keeps_results(self, tts, failing_parts):
+        """Test that a partial failure carries the synthesized audio and the failures."""
+        failing_parts.add("Bye")
+
+        with pytest.raises(BulkOperationError) as exc_info:
+            await tts.synthesize_conversation_chunks(
+                [{"text": "Hi"}, {"text": "Bye"}, {"text": "Thanks"}]
+            )
+
+        error = exc_info.value
+        assert error.results == {"part_0": b"Hi", "part_2": b"Thanks"}
+        assert error.successful_items == ["part_0", "part_2"]
+        assert error.failed_items == [(1, "Failed to synthesize speech: Bye")]
+
+    async def test_total_failure_raises_tts_error(self, tts, failing_parts):
+        """Test that a TTSError is raised when no part could be synthesized."""
+        failing_parts.update({"Hi", "Bye"})
+
+        with pytest.raises(TTSError, match="Conversation synthesis failed: .*Hi"):
+            await tts.synthesize_conversation_chunks([{"text": "Hi"}, {"text": "Bye"}])